@@ -9,12 +9,14 @@ from __future__ import annotations
 
 import argparse
 import base64
+import http.client
 import json
 import os
+import socket
 import sys
-import urllib.error
+import threading
+import urllib.parse
 import urllib.request
-from dataclasses import dataclass
 from datetime import datetime, timezone
 from enum import Enum
 from pathlib import Path
@@ -30,6 +32,16 @@ ENV_FILE = os.path.expanduser("~/.openclaw/secrets/agentic_letters.env")
 ENV_VAR = "AGENTIC_LETTERS_API_KEY"
 RECORDS_DIR = os.path.expanduser("~/.openclaw/workspace/skills/agentic-letters/records")
 
+_ENV_PATH = Path(ENV_FILE)
+_ENV_PREFIX = f"{ENV_VAR}=".encode()
+_B64_CHUNK = 57 * 1024      # multiple of 3, so chunks encode without padding
+_TIMEOUT = 60               # seconds, per socket operation
+_MAX_WORKERS = 32           # concurrent requests for multi-letter commands
+_BATCH_WORKERS = 16         # concurrent uploads for send-batch
+
+# Errors raised when reusing a kept-alive connection the server already closed.
+_STALE_CONNECTION_ERRORS = (http.client.RemoteDisconnected, BrokenPipeError, ConnectionResetError)
+
 
 # ---------------------------------------------------------------------------
 # Error handling
@@ -41,14 +53,27 @@ class ErrorOrigin(Enum):
     NETWORK = "network"
 
 
-@dataclass
 class CLIError:
-    origin: ErrorOrigin
-    message: str
-    code: str | None = None
-    detail: str | None = None
-    field: str | None = None
-    http_status: int | None = None
+    # A plain class, not a dataclass: importing dataclasses pulls in inspect,
+    # which costs more startup time than the rest of this module's imports
+    # once http.client is loaded.
+    __slots__ = ("origin", "message", "code", "detail", "field", "http_status")
+
+    def __init__(
+        self,
+        origin: ErrorOrigin,
+        message: str,
+        code: str | None = None,
+        detail: str | None = None,
+        field: str | None = None,
+        http_status: int | None = None,
+    ):
+        self.origin = origin
+        self.message = message
+        self.code = code
+        self.detail = detail
+        self.field = field
+        self.http_status = http_status
 
     def format(self) -> str:
         parts = [f"[{self.origin.value}] {self.message}"]
@@ -62,10 +87,27 @@ class CLIError:
             parts.append(f"  field: {self.field}")
         return "\n".join(parts)
 
+    def to_dict(self) -> dict:
+        return {
+            "origin": self.origin.value,
+            "message": self.message,
+            "code": self.code,
+            "detail": self.detail,
+            "field": self.field,
+            "http_status": self.http_status,
+        }
+
+
+class CLIFailure(Exception):
+    """Raised by die(); main() reports it on stderr, send-batch per letter."""
+
+    def __init__(self, error: CLIError):
+        super().__init__(error.message)
+        self.error = error
+
 
 def die(err: CLIError) -> NoReturn:
-    print(err.format(), file=sys.stderr)
-    sys.exit(1)
+    raise CLIFailure(err)
 
 
 def die_local(message: str, *, detail: str | None = None) -> NoReturn:
@@ -76,55 +118,190 @@ def die_local(message: str, *, detail: str | None = None) -> NoReturn:
 # API client
 # ---------------------------------------------------------------------------
 
+def _encode_json(obj: dict) -> bytes:
+    """Serialize a request body as compact JSON.
+
+    Non-ASCII is escaped, so arguments Python decoded with surrogateescape
+    (non-UTF-8 locales or file names) still serialize.
+    """
+    return json.dumps(obj, separators=(",", ":")).encode()
+
+
+def _load_json(resp: http.client.HTTPResponse) -> dict:
+    """Parse a JSON response body, decompressing it if the server gzipped it.
+
+    A body that is not valid (gzipped) JSON raises ValueError; network errors
+    while reading propagate unchanged.
+    """
+    # Content codings are case-insensitive; x-gzip is an alias of gzip.
+    if (resp.getheader("Content-Encoding") or "").strip().lower() in ("gzip", "x-gzip"):
+        import gzip  # deferred: only gzipped responses need it
+        import zlib
+
+        with gzip.GzipFile(fileobj=resp) as stream:
+            try:
+                return json.load(stream)
+            except (gzip.BadGzipFile, EOFError, zlib.error) as e:
+                raise ValueError(f"Corrupt gzip body: {e}") from e
+    return json.load(resp)
+
+
+class _FailFastMixin:
+    """Make kept-alive connections give up on a dead peer within _TIMEOUT.
+
+    The socket timeout bounds each blocking connect, send and read, but not
+    how long the kernel keeps retransmitting data the peer never
+    acknowledged. TCP_USER_TIMEOUT (Linux) caps that, so a stale connection
+    fails fast instead of stalling on TCP retries.
+    """
+
+    def connect(self) -> None:
+        super().connect()
+        if hasattr(socket, "TCP_USER_TIMEOUT"):
+            self.sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_USER_TIMEOUT, _TIMEOUT * 1000)
+
+
+class _HTTPConnection(_FailFastMixin, http.client.HTTPConnection):
+    pass
+
+
+class _HTTPSConnection(_FailFastMixin, http.client.HTTPSConnection):
+    pass
+
+
 class AgenticLettersClient:
     """Thin HTTP client for the AgenticLetters API (stdlib only)."""
 
     def __init__(self, api_key: str):
-        self._api_key = api_key
-
-    def _headers(self) -> dict[str, str]:
-        return {
-            "Authorization": f"Bearer {self._api_key}",
+        self._headers = {
+            "Authorization": f"Bearer {api_key}",
             "Content-Type": "application/json",
+            "Accept-Encoding": "gzip",
             "User-Agent": "agentic-letters-skill/1.0",
         }
-
-    def _request(self, method: str, path: str, body: dict | None = None) -> dict:
-        url = f"{API_BASE}{path}"
-        data = json.dumps(body).encode() if body else None
-        req = urllib.request.Request(url, data=data, headers=self._headers(), method=method)
-
+        base = urllib.parse.urlsplit(API_BASE)
+        self._conn_cls = (
+            _HTTPSConnection if base.scheme == "https" else _HTTPConnection
+        )
+        self._host = base.netloc
+        # Honour HTTP(S)_PROXY / NO_PROXY like urlopen did: connect to the
+        # proxy and CONNECT-tunnel through it to the API host.
+        self._tunnel_host: str | None = None
+        self._tunnel_headers: dict[str, str] = {}
+        proxy = urllib.request.getproxies().get(base.scheme)
+        if proxy and not urllib.request.proxy_bypass(base.hostname or ""):
+            proxy_url = urllib.parse.urlsplit(proxy if "://" in proxy else f"http://{proxy}")
+            self._tunnel_host = self._host
+            self._host = proxy_url.hostname + (f":{proxy_url.port}" if proxy_url.port else "")
+            if proxy_url.username:
+                creds = f"{urllib.parse.unquote(proxy_url.username)}:{urllib.parse.unquote(proxy_url.password or '')}"
+                self._tunnel_headers["Proxy-Authorization"] = "Basic " + base64.b64encode(creds.encode()).decode()
+        # Full request targets, so the request path needs no string building.
+        base_path = base.path.rstrip("/")
+        self._letters_path = f"{base_path}/letters"
+        self._credits_path = f"{base_path}/credits"
+        # One kept-alive connection per thread; http.client is not thread-safe.
+        self._local = threading.local()
+        self._conns: list[http.client.HTTPConnection] = []
+        self._conns_lock = threading.Lock()
+
+    def _connection(self) -> http.client.HTTPConnection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = self._local.conn = self._conn_cls(self._host, timeout=_TIMEOUT)
+            if self._tunnel_host:
+                conn.set_tunnel(self._tunnel_host, headers=self._tunnel_headers)
+            with self._conns_lock:
+                self._conns.append(conn)
+        return conn
+
+    def close(self) -> None:
+        """Close all kept-alive connections opened by this client."""
+        with self._conns_lock:
+            for conn in self._conns:
+                conn.close()
+            self._conns.clear()
+            self._local = threading.local()
+
+    def _roundtrip(self, method: str, path: str, data: bytes | bytearray | None) -> http.client.HTTPResponse:
+        conn = self._connection()
+        reused = conn.sock is not None
         try:
-            with urllib.request.urlopen(req, timeout=60) as resp:
-                return json.loads(resp.read())
-        except urllib.error.HTTPError as e:
+            conn.request(method, path, body=data, headers=self._headers)
+            return conn.getresponse()
+        except Exception as e:
+            conn.close()
+            # The server may drop an idle kept-alive connection. Retry once on
+            # a fresh one, but never for POST — that could send a letter twice.
+            if not (reused and method == "GET" and isinstance(e, _STALE_CONNECTION_ERRORS)):
+                raise
+        conn.request(method, path, body=data, headers=self._headers)
+        return conn.getresponse()
+
+    @staticmethod
+    def _read_response(resp: http.client.HTTPResponse) -> dict:
+        if 300 <= resp.status < 400:
+            # Redirects are not followed; a redirect body is not a result.
+            resp.read()
+            die(CLIError(
+                origin=ErrorOrigin.SERVER,
+                message=f"Unexpected redirect (HTTP {resp.status})",
+                http_status=resp.status,
+                detail=f"Location: {resp.getheader('Location')}",
+            ))
+        if resp.status >= 400:
             try:
-                error_body = json.loads(e.read())
+                error_body = _load_json(resp)
             except Exception:
                 die(CLIError(
                     origin=ErrorOrigin.SERVER,
-                    message=f"HTTP {e.code} with non-JSON response",
-                    http_status=e.code,
-                    detail=str(e.reason),
+                    message=f"HTTP {resp.status} with non-JSON response",
+                    http_status=resp.status,
+                    detail=resp.reason,
                 ))
             die(CLIError(
                 origin=ErrorOrigin.SERVER,
-                message=error_body.get("error", f"HTTP {e.code}"),
+                message=error_body.get("error", f"HTTP {resp.status}"),
                 code=error_body.get("code"),
-                http_status=e.code,
+                http_status=resp.status,
                 detail=error_body.get("detail"),
                 field=error_body.get("field"),
             ))
-        except urllib.error.URLError as e:
+        try:
+            return _load_json(resp)
+        except ValueError as e:
             die(CLIError(
-                origin=ErrorOrigin.NETWORK,
-                message="Could not reach the API",
-                detail=str(e.reason),
+                origin=ErrorOrigin.SERVER,
+                message=f"HTTP {resp.status} with non-JSON response",
+                http_status=resp.status,
+                detail=str(e),
             ))
+
+    def _request(self, method: str, path: str, body: dict | bytes | bytearray | None = None) -> dict:
+        if isinstance(body, (bytes, bytearray)):
+            data = body
+        else:
+            data = _encode_json(body) if body else None
+
+        try:
+            resp = self._roundtrip(method, path, data)
+            try:
+                return self._read_response(resp)
+            except BaseException:
+                # Whatever is left of this response would be read as the reply
+                # to the next request on this connection, so drop it.
+                self._connection().close()
+                raise
         except TimeoutError:
             die(CLIError(
                 origin=ErrorOrigin.NETWORK,
-                message="Request timed out after 60 seconds",
+                message=f"Request timed out after {_TIMEOUT} seconds",
+            ))
+        except (OSError, http.client.HTTPException) as e:
+            die(CLIError(
+                origin=ErrorOrigin.NETWORK,
+                message="Could not reach the API",
+                detail=str(e),
             ))
 
     # -- Public methods --
@@ -141,23 +318,15 @@ class AgenticLettersClient:
         letter_type: str = "standard",
         label: str | None = None,
     ) -> dict:
+        import mmap  # deferred: only the send path needs it
+
         path = Path(pdf_path)
         if not path.exists():
             die_local(f"File not found: {pdf_path}")
         if not path.is_file():
             die_local(f"Not a file: {pdf_path}")
 
-        try:
-            pdf_bytes = path.read_bytes()
-        except PermissionError:
-            die_local(f"Permission denied: {pdf_path}")
-        except OSError as e:
-            die_local(f"Cannot read file: {pdf_path}", detail=str(e))
-
-        pdf_b64 = base64.b64encode(pdf_bytes).decode()
-
-        payload: dict = {
-            "pdf": pdf_b64,
+        envelope = {
             "recipient": {
                 "name": name,
                 "street": street,
@@ -166,20 +335,92 @@ class AgenticLettersClient:
                 "country": country,
             },
             "type": letter_type,
+            **({"label": label} if label else {}),
         }
-        if label:
-            payload["label"] = label
 
-        return self._request("POST", "/letters", payload)
+        # Base64 is plain ASCII and needs no JSON escaping, so it is encoded
+        # straight into a body buffer sized up front, between the opening
+        # '{"pdf":"' and the serialized envelope. The PDF is memory-mapped and
+        # encoded from memoryview slices, so the raw file is never copied
+        # into the heap. The chunk size is a multiple of 3, so no padding
+        # appears between chunks.
+        prefix = b'{"pdf":"'
+        suffix = b'",' + _encode_json(envelope)[1:]
+        try:
+            with path.open("rb") as f:
+                before = os.fstat(f.fileno())
+                size = before.st_size
+                b64_len = 4 * ((size + 2) // 3)
+                body = bytearray(len(prefix) + b64_len + len(suffix))
+                body[:len(prefix)] = prefix
+                pos = len(prefix)
+                if size:  # mmap cannot map an empty file
+                    # Map exactly the size the buffer was allocated for; if the
+                    # file shrank since fstat, mmap raises ValueError.
+                    with mmap.mmap(f.fileno(), size, access=mmap.ACCESS_READ) as mm, memoryview(mm) as view:
+                        for i in range(0, size, _B64_CHUNK):
+                            encoded = base64.b64encode(view[i:i + _B64_CHUNK])
+                            body[pos:pos + len(encoded)] = encoded
+                            pos += len(encoded)
+                # Detects a size or mtime change between the first fstat and
+                # the end of encoding, i.e. the file was written while we read
+                # it. (A shrink before mapping already raised ValueError.)
+                after = os.fstat(f.fileno())
+                if (after.st_size, after.st_mtime_ns) != (size, before.st_mtime_ns):
+                    die_local(f"File changed while reading: {pdf_path}")
+        except PermissionError:
+            die_local(f"Permission denied: {pdf_path}")
+        except OSError as e:
+            die_local(f"Cannot read file: {pdf_path}", detail=str(e))
+        except ValueError as e:
+            die_local(f"File changed while reading: {pdf_path}", detail=str(e))
+
+        body[pos:] = suffix
+
+        return self._request("POST", self._letters_path, body)
 
     def get_letter(self, letter_id: str) -> dict:
-        return self._request("GET", f"/letters/{letter_id}")
+        return self._request("GET", f"{self._letters_path}/{letter_id}")
+
+    def get_letters(self, letter_ids: list[str]) -> list[dict]:
+        """Fetch several letters concurrently, in the order given.
+
+        A letter that cannot be fetched is returned as {"id": ..., "error": ...}
+        instead of aborting the others.
+        """
+        if not letter_ids:
+            return []
+        from concurrent.futures import ThreadPoolExecutor  # deferred: only used here
+
+        def fetch(letter_id: str) -> dict:
+            try:
+                return self.get_letter(letter_id)
+            except CLIFailure as e:
+                return {"id": letter_id, "error": e.error.to_dict()}
+
+        with ThreadPoolExecutor(max_workers=min(_MAX_WORKERS, len(letter_ids))) as pool:
+            return list(pool.map(fetch, letter_ids))
 
     def list_letters(self) -> dict:
-        return self._request("GET", "/letters")
+        return self._request("GET", self._letters_path)
+
+    def list_letter_ids(self) -> list[str]:
+        """Return the IDs of all letters, failing if the list has an unexpected shape."""
+        listing = self.list_letters()
+        # Accept {"letters": [...]} as well as a bare top-level array.
+        letters = listing.get("letters") if isinstance(listing, dict) else listing
+        if not isinstance(letters, list) or not all(
+            isinstance(letter, dict) and isinstance(letter.get("id"), str) for letter in letters
+        ):
+            die(CLIError(
+                origin=ErrorOrigin.SERVER,
+                message="Unexpected response from the letter list",
+                detail='Expected {"letters": [...]} with an "id" on every letter',
+            ))
+        return [letter["id"] for letter in letters]
 
     def get_credits(self) -> dict:
-        return self._request("GET", "/credits")
+        return self._request("GET", self._credits_path)
 
 
 # ---------------------------------------------------------------------------
@@ -208,7 +449,7 @@ def save_record(send_result: dict, recipient: dict, label: str | None) -> Path:
         "last_checked": None,
     }
     path = records / f"{date}_{letter_id[:8]}.json"
-    path.write_text(json.dumps(record, indent=2, ensure_ascii=False))
+    path.write_text(json.dumps(record, indent=2, ensure_ascii=False), errors="surrogateescape")
     return path
 
 
@@ -220,34 +461,180 @@ def update_record_status(letter_id: str, status_result: dict) -> None:
         if not f.name.endswith(".json"):
             continue
         try:
-            data = json.loads(f.read_text())
+            data = json.loads(f.read_text(errors="surrogateescape"))
         except Exception:
             continue
         if data.get("id", "").startswith(letter_id) or letter_id.startswith(data.get("id", "")[:8]):
-            data["status"] = status_result.get("status", data["status"])
-            data["last_checked"] = datetime.now(timezone.utc).isoformat()
-            f.write_text(json.dumps(data, indent=2, ensure_ascii=False))
+            _write_status(f, data, status_result)
             return
 
 
+def update_record_statuses(status_results: dict[str, dict]) -> None:
+    """Update the records of many letters, keyed by full letter ID.
+
+    Scans the records directory once instead of once per letter.
+    """
+    pending = dict(status_results)
+    records = _ensure_records_dir()
+    for f in sorted(records.iterdir(), reverse=True):
+        if not pending:
+            return
+        if not f.name.endswith(".json"):
+            continue
+        try:
+            data = json.loads(f.read_text(errors="surrogateescape"))
+        except Exception:
+            continue
+        status_result = pending.pop(data.get("id"), None)
+        if status_result is not None:
+            _write_status(f, data, status_result)
+
+
+def _write_status(path: Path, data: dict, status_result: dict) -> None:
+    data["status"] = status_result.get("status", data["status"])
+    data["last_checked"] = datetime.now(timezone.utc).isoformat()
+    path.write_text(json.dumps(data, indent=2, ensure_ascii=False), errors="surrogateescape")
+
+
+# ---------------------------------------------------------------------------
+# Batch sending
+# ---------------------------------------------------------------------------
+
+def _send_manifest_entry(client: AgenticLettersClient, spec: dict) -> tuple[dict, str | None]:
+    """Send one manifest letter and save its record.
+
+    Returns the send result and, if the letter went out but its record could
+    not be saved, a description of that failure.
+    """
+    if not isinstance(spec, dict):
+        die_local("Manifest entry must be a JSON object")
+    missing = [k for k in ("pdf", "name", "street", "zip", "city") if not spec.get(k)]
+    if missing:
+        die_local("Manifest entry is missing required fields", detail=", ".join(missing))
+
+    recipient = {
+        "name": spec["name"],
+        "street": spec["street"],
+        "zip": spec["zip"],
+        "city": spec["city"],
+        "country": spec.get("country", "DE"),
+    }
+    result = client.send_letter(
+        pdf_path=spec["pdf"],
+        name=recipient["name"],
+        street=recipient["street"],
+        zip_code=recipient["zip"],
+        city=recipient["city"],
+        country=recipient["country"],
+        letter_type=spec.get("type", "standard"),
+        label=spec.get("label"),
+    )
+    try:
+        save_record(result, recipient, spec.get("label"))
+    except Exception as e:
+        return result, f"{type(e).__name__}: {e}"
+    return result, None
+
+
+def send_batch(client: AgenticLettersClient, manifest_path: str) -> int:
+    """Send every letter in a JSONL manifest concurrently.
+
+    Prints one JSON line per letter as it finishes, tagged with its manifest
+    line number. A failed letter does not stop the batch. A letter that was
+    sent but whose local record could not be saved is reported as sent, with
+    a record_error. Returns the number of failures.
+    """
+    from concurrent.futures import ThreadPoolExecutor, as_completed  # deferred: only used here
+
+    try:
+        with open(manifest_path, encoding="utf-8") as f:
+            lines = f.readlines()
+    except FileNotFoundError:
+        die_local(f"File not found: {manifest_path}")
+    except OSError as e:
+        die_local(f"Cannot read file: {manifest_path}", detail=str(e))
+
+    failures = 0
+
+    def emit(
+        line_no: int,
+        *,
+        result: dict | None = None,
+        record_error: str | None = None,
+        error: CLIError | None = None,
+    ) -> None:
+        entry = {"line": line_no, "ok": error is None}
+        if error is None:
+            entry["result"] = result
+            if record_error:
+                entry["record_error"] = record_error
+        else:
+            entry["error"] = error.to_dict()
+        print(json.dumps(entry, ensure_ascii=False), flush=True)
+
+    with ThreadPoolExecutor(max_workers=_BATCH_WORKERS) as pool:
+        futures = {}
+        for line_no, line in enumerate(lines, start=1):
+            if not line.strip():
+                continue
+            try:
+                spec = json.loads(line)
+            except json.JSONDecodeError as e:
+                failures += 1
+                emit(line_no, error=CLIError(
+                    origin=ErrorOrigin.LOCAL, message="Invalid JSON in manifest", detail=str(e),
+                ))
+                continue
+            futures[pool.submit(_send_manifest_entry, client, spec)] = line_no
+
+        for future in as_completed(futures):
+            line_no = futures[future]
+            try:
+                result, record_error = future.result()
+            except CLIFailure as e:
+                failures += 1
+                emit(line_no, error=e.error)
+            except Exception as e:
+                failures += 1
+                emit(line_no, error=CLIError(
+                    origin=ErrorOrigin.LOCAL,
+                    message="Unexpected error; the letter may or may not have been sent",
+                    detail=f"{type(e).__name__}: {e}",
+                ))
+            else:
+                emit(line_no, result=result, record_error=record_error)
+
+    return failures
+
+
 # ---------------------------------------------------------------------------
 # API key resolution
 # ---------------------------------------------------------------------------
 
+_cached_api_key: str | None = None
+
+
 def load_api_key() -> str:
-    """Load API key from environment or secrets file."""
+    """Load API key from environment or secrets file, once per process."""
+    global _cached_api_key
+    if _cached_api_key is None:
+        _cached_api_key = _resolve_api_key()
+    return _cached_api_key
+
+
+def _resolve_api_key() -> str:
     key = os.environ.get(ENV_VAR)
     if key:
         return key.strip()
 
-    env_path = Path(ENV_FILE)
-    if env_path.exists():
-        for line in env_path.read_text().splitlines():
-            line = line.strip()
-            if line.startswith(f"{ENV_VAR}="):
-                val = line.split("=", 1)[1].strip().strip('"').strip("'")
-                if val:
-                    return val
+    if _ENV_PATH.exists():
+        with _ENV_PATH.open("rb") as f:
+            for raw in f:
+                line = raw.strip()
+                if line.startswith(_ENV_PREFIX):
+                    val = line[len(_ENV_PREFIX):].strip().strip(b'"').strip(b"'")
+                    if val:
+                        return val.decode()
 
     die_local(
         "No API key found",
@@ -266,8 +653,12 @@ def build_parser() -> argparse.ArgumentParser:
     )
     sub = parser.add_subparsers(dest="command", required=True)
 
+    # shared by commands that print a single JSON result
+    output_p = argparse.ArgumentParser(add_help=False)
+    output_p.add_argument("--compact", action="store_true", help="Print JSON on one line instead of indented")
+
     # send
-    send_p = sub.add_parser("send", help="Send a letter")
+    send_p = sub.add_parser("send", help="Send a letter", parents=[output_p])
     send_p.add_argument("--pdf", required=True, help="Path to the PDF file")
     send_p.add_argument("--name", required=True, help="Recipient full name")
     send_p.add_argument("--street", required=True, help="Recipient street + number")
@@ -277,58 +668,95 @@ def build_parser() -> argparse.ArgumentParser:
     send_p.add_argument("--type", default="standard", dest="letter_type", help="Letter type (default: standard)")
     send_p.add_argument("--label", help="Optional label for your reference")
 
+    # send-batch
+    batch_p = sub.add_parser("send-batch", help="Send many letters concurrently from a JSONL manifest")
+    batch_p.add_argument("--manifest", required=True, help="Path to a JSONL file, one letter per line")
+
     # status
-    status_p = sub.add_parser("status", help="Check letter status")
+    status_p = sub.add_parser("status", help="Check letter status", parents=[output_p])
     status_p.add_argument("id", help="Letter UUID")
 
+    # status-all
+    sub.add_parser("status-all", help="Check the status of all letters concurrently", parents=[output_p])
+
     # list
-    sub.add_parser("list", help="List all letters")
+    sub.add_parser("list", help="List all letters", parents=[output_p])
 
     # credits
-    sub.add_parser("credits", help="Check remaining credits")
+    sub.add_parser("credits", help="Check remaining credits", parents=[output_p])
 
     return parser
 
 
 def main() -> None:
+    try:
+        _run()
+    except CLIFailure as e:
+        print(e.error.format(), file=sys.stderr)
+        sys.exit(1)
+
+
+def _run() -> None:
     parser = build_parser()
     args = parser.parse_args()
 
     api_key = load_api_key()
     client = AgenticLettersClient(api_key)
 
-    if args.command == "send":
-        result = client.send_letter(
-            pdf_path=args.pdf,
-            name=args.name,
-            street=args.street,
-            zip_code=args.zip,
-            city=args.city,
-            country=args.country,
-            letter_type=args.letter_type,
-            label=args.label,
-        )
-        # Save local record
-        recipient = {
-            "name": args.name,
-            "street": args.street,
-            "zip": args.zip,
-            "city": args.city,
-            "country": args.country,
-        }
-        save_record(result, recipient, args.label)
-    elif args.command == "status":
-        result = client.get_letter(args.id)
-        update_record_status(args.id, result)
-    elif args.command == "list":
-        result = client.list_letters()
-    elif args.command == "credits":
-        result = client.get_credits()
+    try:
+        if args.command == "send":
+            result = client.send_letter(
+                pdf_path=args.pdf,
+                name=args.name,
+                street=args.street,
+                zip_code=args.zip,
+                city=args.city,
+                country=args.country,
+                letter_type=args.letter_type,
+                label=args.label,
+            )
+            # Save local record
+            recipient = {
+                "name": args.name,
+                "street": args.street,
+                "zip": args.zip,
+                "city": args.city,
+                "country": args.country,
+            }
+            save_record(result, recipient, args.label)
+        elif args.command == "send-batch":
+            failures = send_batch(client, args.manifest)
+            sys.exit(1 if failures else 0)
+        elif args.command == "status":
+            result = client.get_letter(args.id)
+            update_record_status(args.id, result)
+        elif args.command == "status-all":
+            letter_ids = client.list_letter_ids()
+            statuses = client.get_letters(letter_ids)
+            update_record_statuses({
+                letter_id: status
+                for letter_id, status in zip(letter_ids, statuses)
+                if "error" not in status
+            })
+            result = {"letters": statuses}
+        elif args.command == "list":
+            result = client.list_letters()
+        elif args.command == "credits":
+            result = client.get_credits()
+        else:
+            parser.print_help()
+            sys.exit(1)
+    finally:
+        client.close()
+
+    if args.compact:
+        out = json.dumps(result, separators=(",", ":"), ensure_ascii=False)
     else:
-        parser.print_help()
-        sys.exit(1)
+        out = json.dumps(result, indent=2, ensure_ascii=False)
+    sys.stdout.buffer.write(out.encode(errors="surrogateescape") + b"\n")
 
-    print(json.dumps(result, indent=2, ensure_ascii=False))
+    if args.command == "status-all" and any("error" in status for status in result["letters"]):
+        sys.exit(1)
 
 
 if __name__ == "__main__":